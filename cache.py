@@ -0,0 +1,115 @@
+import os
+import hashlib
+import orjson
+from flask import current_app, request, stream_with_context
+
+# How long clients and shared caches may reuse GET responses (seconds)
+HTTP_MAX_AGE = 30
+
+# List bodies up to this size are buffered, sent with an ETag and cached;
+# bigger ones are streamed without either
+STREAM_CACHE_LIMIT = 1024 * 1024
+
+# Redis connection (optional). One bounded pool per process; short timeouts
+# keep a stalled Redis from freezing the worker.
+try:
+    import redis
+    redis_pool = redis.ConnectionPool(
+        host=os.getenv('REDIS_HOST', 'localhost'),
+        port=int(os.getenv('REDIS_PORT', 6379)),
+        max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', 128)),
+        socket_timeout=0.2,
+        socket_connect_timeout=0.2,
+        decode_responses=False  # cache entries are raw JSON bytes
+    )
+    redis_client = redis.Redis(connection_pool=redis_pool)
+except:
+    redis_client = None
+
+def cache_get(key):
+    """Return cached bytes for key, or None on a miss or Redis failure"""
+    if redis_client:
+        try:
+            return redis_client.get(key)
+        except redis.RedisError:
+            pass
+    return None
+
+def cache_set(key, body, ttl):
+    """Store bytes under key for ttl seconds, ignoring Redis failures"""
+    if redis_client:
+        try:
+            redis_client.setex(key, ttl, body)
+        except redis.RedisError:
+            pass
+
+def cache_delete(*keys):
+    """Invalidate cache keys, ignoring Redis failures"""
+    if redis_client:
+        try:
+            redis_client.delete(*keys)
+        except redis.RedisError:
+            pass
+
+def json_bytes_response(body, max_age=HTTP_MAX_AGE):
+    """Respond with serialized JSON plus a weak ETag and Cache-Control,
+    answering 304 Not Modified when the client's copy still matches"""
+    response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(hashlib.blake2b(body, digest_size=8).hexdigest(), weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    return response.make_conditional(request)
+
+def cached_json_response(key, ttl, build_payload):
+    """Serve pre-serialized JSON from Redis, building and caching it on a miss"""
+    body = cache_get(key)
+    if body is None:
+        body = orjson.dumps(build_payload())
+        cache_set(key, body, ttl)
+    return json_bytes_response(body)
+
+def _json_batch(batch):
+    """Serialize a batch of rows at once, without the enclosing brackets"""
+    return orjson.dumps([dict(row._mapping) for row in batch])[1:-1]
+
+def cached_json_stream(key, ttl, execute_query):
+    """Serve a JSON array from Redis, or build it from a query
+
+    execute_query runs the statement with yield_per, so rows arrive in
+    batches. Batches are buffered until the body passes STREAM_CACHE_LIMIT
+    bytes: a result that fits is sent whole with an ETag and stored in
+    Redis; a larger one is streamed batch by batch and not cached, so memory
+    stays bounded. Streamed responses carry Cache-Control only, since the
+    ETag needs the complete body.
+    """
+    body = cache_get(key)
+    if body is not None:
+        return json_bytes_response(body)
+
+    batches = execute_query().partitions()
+    chunks = []
+    size = 0
+    for batch in batches:
+        chunk = _json_batch(batch)
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > STREAM_CACHE_LIMIT:
+            break
+    else:
+        body = b'[' + b','.join(chunks) + b']'
+        cache_set(key, body, ttl)
+        return json_bytes_response(body)
+
+    head = b'[' + b','.join(chunks)
+    chunks.clear()
+
+    def generate():
+        yield head
+        for batch in batches:
+            yield b',' + _json_batch(batch)
+        yield b']'
+
+    response = current_app.response_class(stream_with_context(generate()), mimetype='application/json')
+    response.cache_control.public = True
+    response.cache_control.max_age = HTTP_MAX_AGE
+    return response
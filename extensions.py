@@ -0,0 +1,5 @@
+from flask_sqlalchemy import SQLAlchemy
+
+# Created unbound at import so a preloading server shares it with its
+# workers; create_app() binds it to the application.
+db = SQLAlchemy()
@@ -0,0 +1,22 @@
+import multiprocessing
+import os
+
+# Gunicorn settings: gevent workers for the I/O bound API endpoints
+wsgi_app = 'wsgi:application'
+bind = os.getenv('BIND', '0.0.0.0:5000')
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gevent'
+worker_connections = int(os.getenv('WORKER_CONNECTIONS', 1000))
+accesslog = '-'
+
+# Build the app once in the master so workers share its pages copy-on-write
+preload_app = True
+
+def post_fork(server, worker):
+    """Set up per-worker state after forking from the master"""
+    from extensions import db
+    from wsgi import application
+
+    # Pooled DB sockets belong to the master; open fresh ones in the worker
+    with application.app_context():
+        db.engine.dispose(close=False)
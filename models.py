@@ -0,0 +1,69 @@
+from datetime import datetime
+from sqlalchemy import func, insert
+from extensions import db
+
+# Database Models
+class User(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    email = db.Column(db.String(120), unique=True, nullable=False)
+    role = db.Column(db.String(50), default='user', index=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_login = db.Column(db.DateTime, default=datetime.utcnow)
+
+class Product(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(100), nullable=False)
+    price = db.Column(db.Float, nullable=False, index=True)
+    category = db.Column(db.String(50), nullable=False)
+    stock = db.Column(db.Integer, default=0)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+# Category filters compare lower(category), so index that expression
+db.Index('ix_product_category_lower', func.lower(Product.category))
+
+class Order(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
+    total = db.Column(db.Float, nullable=False)
+    status = db.Column(db.String(20), default='pending')
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+# Schema and seed data
+SAMPLE_USERS = [
+    {'name': 'John Doe', 'email': 'john@example.com', 'role': 'admin'},
+    {'name': 'Jane Smith', 'email': 'jane@example.com', 'role': 'user'},
+    {'name': 'Bob Johnson', 'email': 'bob@example.com', 'role': 'user'},
+    {'name': 'Alice Brown', 'email': 'alice@example.com', 'role': 'manager'}
+]
+
+SAMPLE_PRODUCTS = [
+    {'name': 'Laptop Pro', 'price': 1299.99, 'category': 'Electronics', 'stock': 45},
+    {'name': 'Wireless Headphones', 'price': 199.99, 'category': 'Electronics', 'stock': 120},
+    {'name': 'Coffee Maker', 'price': 89.99, 'category': 'Appliances', 'stock': 30},
+    {'name': 'Smartphone', 'price': 799.99, 'category': 'Electronics', 'stock': 75},
+    {'name': 'Desk Chair', 'price': 299.99, 'category': 'Furniture', 'stock': 25}
+]
+
+def init_db():
+    """Create tables and seed sample data (safe to re-run)"""
+    db.create_all()
+    
+    # Bulk insert, skipping users whose email already exists
+    dialect = db.engine.dialect.name
+    if dialect == 'postgresql':
+        from sqlalchemy.dialects.postgresql import insert as upsert
+    elif dialect == 'sqlite':
+        from sqlalchemy.dialects.sqlite import insert as upsert
+    else:
+        raise RuntimeError(f'init-db does not support {dialect}')
+    
+    inserted = db.session.execute(
+        upsert(User).on_conflict_do_nothing(index_elements=['email']).returning(User.id),
+        SAMPLE_USERS
+    ).all()
+    
+    # Products have no natural key, so only seed them alongside a fresh user seed
+    if inserted:
+        db.session.execute(insert(Product), SAMPLE_PRODUCTS)
+    db.session.commit()
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+from flask import Blueprint, jsonify
+from sqlalchemy import func, select
+from cache import cached_json_response
+from extensions import db
+from models import Order, Product, User
+
+analytics = Blueprint('analytics', __name__)
+
+@analytics.route('/api/analytics')
+def get_analytics():
+    """Get basic analytics data"""
+    try:
+        def load_analytics():
+            # Recent orders (last 7 days)
+            week_ago = datetime.utcnow() - timedelta(days=7)
+            
+            # All counts as scalar subqueries of a single statement
+            row = db.session.execute(select(
+                select(func.count()).select_from(User).scalar_subquery().label('total_users'),
+                select(func.count()).select_from(Product).scalar_subquery().label('total_products'),
+                select(func.count()).select_from(Order).scalar_subquery().label('total_orders'),
+                select(func.count()).select_from(Order).where(Order.created_at >= week_ago)
+                    .scalar_subquery().label('recent_orders')
+            )).one()
+            
+            return {**row._mapping, 'generated_at': datetime.utcnow()}
+        
+        # Analytics tolerate staleness, so the whole result is cached
+        return cached_json_response('analytics', 60, load_analytics)
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -0,0 +1,41 @@
+import random
+import time
+from flask import Blueprint, jsonify, request
+
+# Latency and error injection for chaos/load testing only. Registered by
+# app.py when FEATURE_CHAOS is set so the regular request path never
+# sleeps or touches the random module. time.sleep is cooperative under
+# gevent's monkey patching (see wsgi.py).
+chaos = Blueprint('chaos', __name__)
+
+# Private generator so chaos requests don't contend on the global one
+rng = random.Random()
+
+DELAYED_ENDPOINTS = {'users.get_users', 'users.create_user', 'products.get_products',
+                     'orders.create_order', 'analytics.get_analytics'}
+
+# Simulated failures per endpoint: (error message, status code)
+FAILING_ENDPOINTS = {
+    'users.get_users': ('Database connection failed', 500),
+    'products.get_products': ('Product service unavailable', 503),
+    'orders.create_order': ('Payment processing failed', 402)
+}
+
+def simulate_delay():
+    """Simulate realistic API delay"""
+    delay = rng.uniform(0.1, 0.8)
+    time.sleep(delay)
+
+def simulate_error():
+    """Simulate random errors for monitoring"""
+    return rng.random() < 0.05  # 5% error rate
+
+@chaos.before_app_request
+def inject_chaos():
+    """Delay the API endpoints and fail a share of their requests"""
+    if request.endpoint in DELAYED_ENDPOINTS:
+        simulate_delay()
+    
+    if request.endpoint in FAILING_ENDPOINTS and simulate_error():
+        message, status = FAILING_ENDPOINTS[request.endpoint]
+        return jsonify({'error': message}), status
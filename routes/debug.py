@@ -0,0 +1,18 @@
+import random
+import gevent
+from flask import Blueprint, jsonify
+
+# Endpoints for load testing only, registered when ENABLE_DEBUG_ENDPOINTS
+# is set. Keep them free of C extensions: monkey patching makes time.sleep
+# and sockets cooperative, but a sleep or blocking call inside native code
+# would still stall every greenlet in the worker.
+debug = Blueprint('debug', __name__)
+
+rng = random.Random()
+
+@debug.route('/api/slow-endpoint')
+def slow_endpoint():
+    """Intentionally slow endpoint for testing"""
+    # Simulate very slow database query, yielding to other greenlets
+    gevent.sleep(rng.uniform(2, 5))
+    return jsonify({'message': 'This was a slow operation', 'duration': '2-5 seconds'})
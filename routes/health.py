@@ -0,0 +1,31 @@
+import time
+import orjson
+from flask import Blueprint
+from cache import json_bytes_response, redis_client
+
+health = Blueprint('health', __name__)
+
+# Health check body is static apart from the timestamp
+HEALTH_STATUS = {
+    'status': 'healthy',
+    'version': '1.0.0',
+    'database': 'connected',
+    'redis': 'connected' if redis_client else 'not available'
+}
+
+# The timestamp only has second resolution, so the body is rebuilt at most
+# once per second: (epoch second, body)
+_health_cache = (0, b'')
+
+@health.route('/api/health')
+def health_check():
+    """Health check endpoint"""
+    global _health_cache
+    second = int(time.time())
+    cached_second, body = _health_cache
+    if second != cached_second:
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(second))
+        body = orjson.dumps({**HEALTH_STATUS, 'timestamp': timestamp})
+        _health_cache = (second, body)
+    # Shared caches may only reuse it for as long as the body itself is reused
+    return json_bytes_response(body, max_age=1)
@@ -0,0 +1,50 @@
+from flask import Blueprint, jsonify, request
+from extensions import db
+from models import Order, User
+
+orders = Blueprint('orders', __name__)
+
+@orders.route('/api/orders', methods=['POST'])
+def create_order():
+    """Create a new order"""
+    try:
+        data = request.get_json()
+        
+        # Validate order data
+        user = db.session.get(User, data['userId'])
+        if not user:
+            return jsonify({'error': 'User not found'}), 404
+        
+        order = Order(
+            user_id=data['userId'],
+            total=data['total'],
+            status='confirmed'
+        )
+        db.session.add(order)
+        db.session.commit()
+        
+        return jsonify({
+            'id': order.id,
+            'status': order.status,
+            'total': order.total,
+            'created_at': order.created_at,
+            'message': 'Order placed successfully'
+        }), 201
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
+
+@orders.route('/api/orders/<int:order_id>')
+def get_order(order_id):
+    """Get a single order"""
+    order = db.session.get(Order, order_id)
+    if not order:
+        return jsonify({'error': 'Order not found'}), 404
+    
+    return jsonify({
+        'id': order.id,
+        'user_id': order.user_id,
+        'status': order.status,
+        'total': order.total,
+        'created_at': order.created_at
+    })
@@ -0,0 +1,38 @@
+from flask import Blueprint, jsonify, request
+from sqlalchemy import func, lambda_stmt, select
+from cache import cached_json_stream
+from extensions import db
+from models import Product
+
+products = Blueprint('products', __name__)
+
+@products.route('/api/products')
+def get_products():
+    """Get all products with optional filtering"""
+    try:
+        category = request.args.get('category', '').lower()
+        min_price = request.args.get('min_price', type=float)
+        max_price = request.args.get('max_price', type=float)
+        
+        def load_products():
+            # Lambda statements cache the compiled SQL per filter combination;
+            # the filter values are extracted as bound parameters
+            query = lambda_stmt(lambda: select(Product.id, Product.name, Product.price,
+                                               Product.category, Product.stock, Product.created_at))
+            
+            if category:
+                query += lambda s: s.where(func.lower(Product.category) == category)
+            if min_price:
+                query += lambda s: s.where(Product.price >= min_price)
+            if max_price:
+                query += lambda s: s.where(Product.price <= max_price)
+            
+            # yield_per streams rows (server-side cursor on Postgres)
+            return db.session.execute(query, execution_options={'yield_per': 500})
+        
+        key = f"products:{category or 'all'}:{min_price or ''}:{max_price or ''}"
+        return cached_json_stream(key, 60, load_products)
+        
+    except Exception as e:
+        print(f"Error fetching products: {e}")
+        return jsonify({'error': 'Failed to fetch products'}), 500
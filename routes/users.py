@@ -0,0 +1,52 @@
+from flask import Blueprint, jsonify, request
+from sqlalchemy import lambda_stmt, select
+from cache import cache_delete, cached_json_stream
+from extensions import db
+from models import User
+
+users = Blueprint('users', __name__)
+
+@users.route('/api/users')
+def get_users():
+    """Get all users with optional filtering"""
+    try:
+        role = request.args.get('role')
+        
+        def load_users():
+            # Select plain rows so no ORM objects are built for serialization
+            query = lambda_stmt(lambda: select(User.id, User.name, User.email, User.role,
+                                               User.created_at, User.last_login))
+            
+            if role:
+                query += lambda s: s.where(User.role == role)
+            
+            # yield_per streams rows (server-side cursor on Postgres)
+            return db.session.execute(query, execution_options={'yield_per': 500})
+        
+        return cached_json_stream(f"users:{role or 'all'}", 60, load_users)
+        
+    except Exception as e:
+        print(f"Error fetching users: {e}")
+        return jsonify({'error': 'Failed to fetch users'}), 500
+
+@users.route('/api/users', methods=['POST'])
+def create_user():
+    """Create a new user"""
+    try:
+        data = request.get_json()
+        user = User(
+            name=data['name'],
+            email=data['email'],
+            role=data.get('role', 'user')
+        )
+        db.session.add(user)
+        db.session.commit()
+        cache_delete('users:all', f'users:{user.role}')
+        
+        return jsonify({
+            'id': user.id,
+            'message': 'User created successfully'
+        }), 201
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 400
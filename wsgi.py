@@ -0,0 +1,19 @@
+# Gevent must patch the standard library before anything else opens sockets,
+# so this runs ahead of the app import (and the New Relic agent inside it).
+from gevent import monkey
+monkey.patch_all()
+
+import os
+from dotenv import load_dotenv
+
+# DATABASE_URL may only be set in .env, which app.py would load too late
+load_dotenv()
+
+# psycopg2 is a C extension and is not covered by monkey.patch_all()
+if os.getenv('DATABASE_URL', '').startswith('postgres'):
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
+
+from app import create_app
+
+application = create_app()